@@ -1,28 +1,33 @@
-import collections
-import dataclasses
-import functools
 import logging
 import logging.config
 import pathlib
 import shutil
 import threading
+import weakref
 
 from d810.core import typing
 
 LOG_FILENAME = "d810.log"
 Z3_TEST_FILENAME = "z3_check_instructions_substitution.py"
 
-_config = collections.Counter(version=0)
+# Count of logging config changes; not read on any hot path, only exposed
+# through LevelFlag.get_config_version() for callers detecting changes.
+_config_version = 0
+# Every live LevelFlag, refreshed in place whenever the config version bumps.
+_level_flags: "weakref.WeakSet[LevelFlag]" = weakref.WeakSet()
+# True until a level is changed at runtime; see _LevelCheck.
+_static_config = True
+_LEVEL_CHECKS = ("debug_on", "info_on", "warning_on", "error_on", "critical_on")
 
 
-@dataclasses.dataclass(slots=True)
 class LevelFlag:
     """
     LevelFlag provides a fast, zero-allocation cached boolean check for whether a logger is
     enabled for a given level.
 
-    It avoids repeated calls to logger.isEnabledFor(level) in performance-critical code, and automatically
-    refreshes its cache when logging configuration changes.
+    It avoids repeated calls to logger.isEnabledFor(level) in performance-critical code. Instead
+    of checking for configuration changes on every access, each live flag is refreshed when
+    :meth:`bump_config_version` runs, so ``bool(flag)`` is a single attribute read.
 
     See: https://docs.python.org/3/howto/logging.html#optimization
 
@@ -35,30 +40,80 @@ class LevelFlag:
             do_expensive_debug_stuff()
     """
 
-    _logger_name: str
-    _level: int
-    _last_version: int = dataclasses.field(default=-1, init=False)
-    _cached: bool = dataclasses.field(default=False, init=False)
+    __slots__ = ("_logger_name", "_level", "_cached", "_logger", "__weakref__")
+
+    def __init__(self, logger_name: str, level: int):
+        self._logger_name = logger_name
+        self._level = level
+        self._cached = False
+        self._logger: logging.Logger | None = None
+        self.refresh()
+        _level_flags.add(self)
 
     def __bool__(self) -> bool:
-        current = self.get_config_version()
-        if self._last_version != current:
-            # config changed (or first call) → re-compute once
-            self._cached = getLogger(self._logger_name).isEnabledFor(self._level)
-            self._last_version = current
         return self._cached
 
     def __repr__(self):
         lvlname = logging.getLevelName(self._level)
         return f"<LevelFlag {self._logger_name}≥{lvlname}>"
 
+    def refresh(self) -> None:
+        """Re-read the enabled state from the underlying logger."""
+        lg = self._logger
+        if lg is None:
+            lg = self._logger = getLogger(self._logger_name)
+        self._cached = lg.isEnabledFor(self._level)
+
     @staticmethod
-    def bump_config_version() -> None:
-        _config["version"] += 1
+    def bump_config_version(reload: bool = False) -> None:
+        """Refresh every live flag; with *reload*, also re-resolve their loggers."""
+        global _config_version
+        _config_version += 1
+        # config changed → push the new state to every flag once
+        for flag in list(_level_flags):
+            if reload:
+                flag._logger = None
+            flag.refresh()
 
     @staticmethod
     def get_config_version() -> int:
-        return _config["version"]
+        """Return how many times the logging config has changed."""
+        return _config_version
+
+
+class _LevelCheck:
+    """Cached ``<level>_on`` attribute for :class:`D810Logger`.
+
+    While the logging config is static (no :meth:`LoggerConfigurator.set_level`
+    yet) the first access stores a plain ``bool`` in the instance dict, so
+    ``if logger.debug_on:`` is a dict hit with no Python-level call at all.
+    Once levels change at runtime, a :class:`LevelFlag` is stored instead so
+    later changes are picked up.
+    """
+
+    def __init__(self, level: int):
+        self._level = level
+
+    def __set_name__(self, owner, name: str):
+        self.__name__ = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if _static_config:
+            value = instance.isEnabledFor(self._level)
+        else:
+            value = LevelFlag(instance.name, self._level)
+        instance.__dict__[self.__name__] = value
+        return value
+
+
+def _reset_level_checks() -> None:
+    """Drop every cached ``<level>_on`` value so the next access recomputes it."""
+    for lg in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(lg, D810Logger):
+            for name in _LEVEL_CHECKS:
+                lg.__dict__.pop(name, None)
 
 
 class D810Logger(logging.Logger):
@@ -79,26 +134,12 @@ class D810Logger(logging.Logger):
     # ------------------------------------------------------------------
     # Quick level checks (cached)
     # ------------------------------------------------------------------
-    @functools.cached_property
-    def debug_on(self) -> LevelFlag:  # noqa: D401
-        """Fast flag: is DEBUG enabled for this logger?"""
-        return LevelFlag(self.name, logging.DEBUG)
-
-    @functools.cached_property
-    def info_on(self) -> LevelFlag:  # noqa: D401
-        return LevelFlag(self.name, logging.INFO)
-
-    @functools.cached_property
-    def warning_on(self) -> LevelFlag:  # noqa: D401
-        return LevelFlag(self.name, logging.WARNING)
-
-    @functools.cached_property
-    def error_on(self) -> LevelFlag:  # noqa: D401
-        return LevelFlag(self.name, logging.ERROR)
-
-    @functools.cached_property
-    def critical_on(self) -> LevelFlag:  # noqa: D401
-        return LevelFlag(self.name, logging.CRITICAL)
+    debug_on = _LevelCheck(logging.DEBUG)
+    """Fast flag: is DEBUG enabled for this logger?"""
+    info_on = _LevelCheck(logging.INFO)
+    warning_on = _LevelCheck(logging.WARNING)
+    error_on = _LevelCheck(logging.ERROR)
+    critical_on = _LevelCheck(logging.CRITICAL)
 
     # ---------------------------------------------------------------------
     # MDC helpers
@@ -154,9 +195,9 @@ class D810Logger(logging.Logger):
         sinfo=None,
     ):
         """Inject the current MDC into every ``LogRecord`` that we create."""
-        if not extra:
-            extra = {}
-        extra.update(self.mdc())
+        # Copy rather than update: *extra* belongs to the caller, which may be
+        # foreign code once D810Logger is the process-wide logger class.
+        extra = {**(extra or {}), **self.mdc()}
         return super().makeRecord(
             name,
             level,
@@ -333,16 +374,13 @@ class LoggerConfigurator:
         - If `case_insensitive` is True, perform case-insensitive matching.
         """
         mgr = logging.Logger.manager
-        # 1) dynamic ones
-        dyn = {
+        # static ones from your dictConfig, plus dynamic ones from the manager
+        all_names = set(conf["loggers"])
+        all_names.update(
             name
             for name, logger in mgr.loggerDict.items()
             if isinstance(logger, logging.Logger)
-        }
-        # 2) static ones from your dictConfig
-        stat = set(conf["loggers"].keys())
-
-        all_names = dyn | stat
+        )
 
         if prefix is None:
             return sorted(all_names)
@@ -354,18 +392,26 @@ class LoggerConfigurator:
 
         if case_insensitive:
             prefixes = [p.lower() for p in prefixes]
+        exact = frozenset(prefixes)
+        # str.startswith accepts a tuple and scans it in C
+        dotted = tuple(p + "." for p in prefixes)
+
+        if case_insensitive:
+            # Cheap first-character test before paying for name.lower()
+            first_chars = frozenset(p[:1] for p in prefixes)
 
             def match(name: str) -> bool:
+                if name[:1].lower()[:1] not in first_chars:
+                    return False
                 lname = name.lower()
-                return any(lname == p or lname.startswith(p + ".") for p in prefixes)
+                return lname in exact or lname.startswith(dotted)
 
         else:
 
             def match(name: str) -> bool:
-                return any(name == p or name.startswith(p + ".") for p in prefixes)
+                return name in exact or name.startswith(dotted)
 
-        filtered = filter(match, all_names)
-        return sorted(filtered)
+        return sorted(filter(match, all_names))
 
     @staticmethod
     def get_level(name: str) -> int:
@@ -382,6 +428,11 @@ class LoggerConfigurator:
             raise ValueError(f"Unknown logging level: {level_name}")
         # print(f"Setting level for {logger_name} to {level_name}")
         getLogger(logger_name, lvl).setLevel(lvl)
+        global _static_config
+        if _static_config:
+            # levels now change at runtime: swap cached bools for LevelFlags
+            _static_config = False
+            _reset_level_checks()
         # invalidate all LevelFlags
         LevelFlag.bump_config_version()
 
@@ -407,6 +458,12 @@ def configure_loggers(log_dir: str | pathlib.Path) -> None:
         log_dir / Z3_TEST_FILENAME
     ).as_posix()
 
+    # Make loggers created from here on native D810Loggers so getLogger()
+    # does not have to wrap and swap them in the manager. Leave any custom
+    # logger class installed by someone else in the host process alone.
+    if logging.getLoggerClass() is logging.Logger:
+        logging.setLoggerClass(D810Logger)
+
     # Apply the configuration
     logging.config.dictConfig(conf)
 
@@ -414,7 +471,8 @@ def configure_loggers(log_dir: str | pathlib.Path) -> None:
     z3_file_logger.info(
         "from z3 import BitVec, BitVecVal, UDiv, URem, LShR, UGT, UGE, ULT, ULE, prove\n\n"
     )
-    LevelFlag.bump_config_version()
+    _reset_level_checks()
+    LevelFlag.bump_config_version(reload=True)
 
 
 def getLogger(name: str, default_level: int = logging.INFO) -> D810Logger:
@@ -436,13 +494,23 @@ def getLogger(name: str, default_level: int = logging.INFO) -> D810Logger:
        **and** that has **no handlers**, the record would be lost.  We flip
        ``propagate`` back to *True* so that messages bubble to the root
        handlers configured above.
+
+    Once :pyfunc:`configure_loggers` has installed :class:`D810Logger` as the
+    logger class, new loggers are created with the right type and are
+    returned directly; wrapping is only needed for loggers created earlier.
     """
 
     name = name or __name__
+    created = not isinstance(
+        logging.Logger.manager.loggerDict.get(name), logging.Logger
+    )
     # grab (or create) the underlying Logger
     base = logging.getLogger(name)
     # if it’s already the right type, just return it
     if isinstance(base, D810Logger):
+        if created:
+            # same starting level a freshly wrapped logger would get
+            base.setLevel(default_level)
         return base
     # otherwise wrap it in the subclass
     loglvl = base.level
@@ -1,11 +1,10 @@
-import collections
 import dataclasses
 import functools
 import importlib
 import sys
 from abc import ABCMeta
 from functools import cache, wraps
-from types import GenericAlias, MappingProxyType
+from types import GenericAlias, MappingProxyType, UnionType
 from collections.abc import MutableMapping
 from weakref import WeakKeyDictionary
 
@@ -30,6 +29,7 @@ from d810.core.typing import (
     TypeAlias,
     TypeAliasType,
     TypeVar,
+    Union,
     cast,
     get_args,
     get_origin,
@@ -41,6 +41,15 @@ T = TypeVar("T")
 _R = TypeVar("_R", bound="Registrant")
 AnnotatedAny: TypeAlias = Annotated[Any, ...]  # safely parameterized
 
+# Bumped on every registry mutation; invalidates cached registry lookups.
+_registry_version = [0]
+_subclasses_cache: WeakKeyDictionary[type, tuple[int, tuple[type, ...]]] = (
+    WeakKeyDictionary()
+)
+_all_cache: WeakKeyDictionary[type, tuple[int, tuple[type, ...]]] = (
+    WeakKeyDictionary()
+)
+
 
 class NotGiven:
     """Placeholder for value which isn't given."""
@@ -210,39 +219,55 @@ def typename(t: TypeRef) -> str:
     return str(t)
 
 
+_TYPECHECK_HANDLERS: dict[Any, Callable[[Any, tuple[Any, ...]], bool]] = {
+    Literal: lambda value, args: value in args,
+    Annotated: lambda value, args: typecheck(value, args[0]),
+}
+# Parameterized origins which isinstance() still understands.
+_ISINSTANCE_ORIGINS = frozenset({Union, UnionType})
+
+
 def typecheck(value: Any, t: TypeRef) -> bool:
     """
     More featureful type checking. Supports isinstance, but also the zoo of
     `typing` types which are not supported by isinstance.
     """
 
-    try:
-        # type, Optional, Union, @runtime_checkable
-        return isinstance(value, t)  # type: ignore
-    except TypeError:
-        pass
-
     if t is Any:
         return True
-    if t in {None, type(None)}:
-        return value is None
-    if t in {AnyStr, LiteralString}:
-        return isinstance(value, (str, bytes))
+    # Plain classes (incl. @runtime_checkable protocols). Aliases such as
+    # list[int] pass isinstance(t, type), so test the real metatype instead.
+    if issubclass(type(t), type):
+        try:
+            return isinstance(value, t)
+        except TypeError:
+            # e.g. non-runtime_checkable Protocols, TypedDicts
+            return False
 
     # Generic types
 
-    origin, args = get_origin(t), get_args(t)
-
-    if origin is Literal:
-        return value in args
+    origin = get_origin(t)
+    if origin is not None:
+        handler = _TYPECHECK_HANDLERS.get(origin)
+        if handler is not None:
+            return handler(value, get_args(t))
+        if origin not in _ISINSTANCE_ORIGINS:
+            # Subscripted generics are rejected by isinstance
+            return False
 
-    if origin is Annotated:
-        return typecheck(value, args[0])
+    if t is None:
+        return value is None
+    if t in {AnyStr, LiteralString}:
+        return isinstance(value, (str, bytes))
 
     if isinstance(t, TypeAliasType):
         return typecheck(value, t.__value__)  # type: ignore [attr-defined]
 
-    return False
+    try:
+        # Optional, Union, tuples of types
+        return isinstance(value, t)  # type: ignore
+    except TypeError:
+        return False
 
 
 # Alternatively, could use ForwardRef._evaluate but that's private. This is at least public and legal.
@@ -251,17 +276,47 @@ def resolve_forward_ref(
     globalns: dict[str, Any] | None = None,
     localns: dict[str, Any] | MappingProxyType[str, Any] | None = None,
 ):
-    """Resolve a singular forward reference."""
+    """Resolve a singular forward reference.
 
-    def dummy(x: TypeRef):
-        pass
+    String arguments nested in builtin generics (``list["int"]``) are
+    resolved too, including when *obj* itself is such a string.
+    """
 
     _localns: dict[str, Any] = (
         cast(dict[str, Any], localns) if localns is not None else {}
     )
+    if globalns is None:
+        globalns = globals()
+    if isinstance(obj, str):
+        # A bare name/expression needs none of the get_type_hints machinery
+        obj = eval(obj, globalns, _localns)
+        if not isinstance(obj, GenericAlias):
+            return obj
+
+    def dummy(x):
+        pass
+
+    dummy.__annotations__ = {"x": _forward_generic_args(obj)}
     return get_type_hints(dummy, globalns, _localns)["x"]
 
 
+def _forward_generic_args(obj: Any) -> Any:
+    """Wrap str args of builtin generics in ForwardRef, recursively.
+
+    get_type_hints only evaluates ForwardRef args; on Python 3.10 it leaves
+    plain strings inside ``list[...]`` and friends untouched.
+    """
+    # Exact type only: subclasses such as collections.abc.Callable[...]
+    # flatten their args and cannot be rebuilt this way.
+    if type(obj) is not GenericAlias:
+        return obj
+    args = tuple(
+        ForwardRef(arg) if isinstance(arg, str) else _forward_generic_args(arg)
+        for arg in obj.__args__
+    )
+    return GenericAlias(obj.__origin__, args)
+
+
 class deferred_property(Generic[T]):
     """A property which can be resolved later with minimal friction."""
 
@@ -311,22 +366,28 @@ class deferred_property(Generic[T]):
 def lazy_type(t: DeferTypeRef, cls: Optional[type] = None) -> Defer[type]:
     """Return a lazy type which can be resolved later."""
 
-    if isinstance(t, (type, Callable)):
+    # Cheapest check first; callable() is the C-level equivalent of the
+    # isinstance(t, Callable) protocol check.
+    if isinstance(t, type) or callable(t):
         return cast(type | Callable, t)
     if cls is None:
         raise ValueError("cls must be given if t is unbound")
 
-    @cache
-    def factory():
-        global_ns = importlib.import_module(cls.__module__).__dict__
-        return resolve_forward_ref(t, global_ns, cls.__dict__)
+    return functools.partial(_resolve_lazy_type, cls, t)
+
 
-    return factory
+@cache
+def _resolve_lazy_type(cls: type, t: TypeRef) -> type:
+    # The owning module is already loaded; read its namespace directly
+    module = sys.modules.get(cls.__module__) or importlib.import_module(
+        cls.__module__
+    )
+    return resolve_forward_ref(t, module.__dict__, cls.__dict__)
 
 
 class FilterableGenerator(Generic[T]):
     """
-    Wraps an Iterable of classes and a list of predicates.
+    Wraps an Iterable of classes and a tuple of predicates.
     You can .filter(...) repeatedly to build up predicates,
     and only when you iterate do we apply them.
     """
@@ -334,18 +395,21 @@ class FilterableGenerator(Generic[T]):
     def __init__(
         self,
         source: Iterable[T],
-        predicates: list[Callable[[T], bool]] | None = None,
+        predicates: Iterable[Callable[[T], bool]] | None = None,
     ):
         self._source = source
-        self._preds = list(predicates or [])
+        self._preds: tuple[Callable[[T], bool], ...] = tuple(predicates or ())
 
     def filter(self, predicate: Callable[[T], bool]) -> "FilterableGenerator[T]":
-        return FilterableGenerator(self._source, self._preds + [predicate])
+        return FilterableGenerator(self._source, self._preds + (predicate,))
 
     def __iter__(self):
-        for cls in self._source:
-            if all(pred(cls) for pred in self._preds):
-                yield cls
+        # Stack one builtin filter per predicate: each item is tested in
+        # predicate order and dropped at the first failure, all in C.
+        it = iter(self._source)
+        for pred in self._preds:
+            it = filter(pred, it)
+        return it
 
     def __repr__(self):
         # avoid consuming the generator!
@@ -353,31 +417,11 @@ class FilterableGenerator(Generic[T]):
 
 
 class Registry(ABCMeta):
-    """Metaclass for registering subclasses."""
-
-    def __init__(
-        self,
-        name: str,
-        bases: tuple[type, ...],
-        attrs: dict[str, Any],
-    ):
-        """Metaclass constructor that wires up class registries.
+    """Metaclass for registering subclasses.
 
-        Every concrete subclass receives its *own* ``registry`` and
-        ``lazy_registry`` dictionaries so that sibling hierarchies do *not*
-        accidentally share the same registry from a common ancestor.
-        """
-
-        super().__init__(name, bases, attrs)
-
-        # Skip wiring for the Registrant sentinel itself.
-        if name == "Registrant":
-            return
-
-        # If this is a direct subclass of Registrant, give it its own registries
-        if Registrant in bases:
-            self.registry: dict[str, type[Any]] = {}
-            self.lazy_registry: dict[str, Thunk[type[Any]]] = {}
+    Registry wiring lives in :meth:`Registrant.__init_subclass__`; this
+    metaclass only supplies ABC support.
+    """
 
 
 class Registrant(metaclass=Registry):
@@ -393,6 +437,13 @@ class Registrant(metaclass=Registry):
     """Registry of lazy registrations."""
 
     def __init_subclass__(cls):
+        # Every direct subclass of Registrant receives its *own* ``registry``
+        # and ``lazy_registry`` dictionaries so that sibling hierarchies do
+        # *not* accidentally share the same registry from a common ancestor.
+        if Registrant in cls.__bases__:
+            cls.registry = {}
+            cls.lazy_registry = {}
+
         # Register *cls* into every immediate parent that is itself a
         # Registrant (except for the root Registrant, which we leave empty to
         # avoid an unwieldy global registry).
@@ -434,12 +485,14 @@ class Registrant(metaclass=Registry):
         # Pop any lazy registration
         cls.lazy_registry.pop(name, None)
         cls.registry[name] = alt
+        _registry_version[0] += 1
 
     @classmethod
     def lazy_register(cls, load: Thunk[type[Any]]):
         """Register a thunk (hook) under its function name for lazy initialization."""
         if load.__name__ not in cls.registry:
             cls.lazy_registry[load.__name__] = load
+            _registry_version[0] += 1
 
     @classmethod
     def get(cls, name: str) -> _R:  # type: ignore
@@ -450,6 +503,7 @@ class Registrant(metaclass=Registry):
             # move from lazy to real registry
             del cls.lazy_registry[key]
             cls.registry[key] = sub
+            _registry_version[0] += 1
             return cast(_R, sub)
 
         return cast(_R, cls.registry[key])
@@ -467,9 +521,18 @@ class Registrant(metaclass=Registry):
             return None
 
     @classmethod
-    def all(cls) -> list[type[Any]]:
-        """Return every concrete subclass currently registered for *cls*."""
-        return list(cls.registry.values())
+    def all(cls) -> tuple[type[Any], ...]:
+        """Return every concrete subclass currently registered for *cls*.
+
+        The result is an immutable snapshot, cached until the next registration.
+        """
+        version = _registry_version[0]
+        cached = _all_cache.get(cls)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        out = tuple(cls.registry.values())
+        _all_cache[cls] = (version, out)
+        return out
 
     @classmethod
     def get_subclasses(cls, base: type | None = None) -> list[type]:
@@ -484,6 +547,7 @@ class Registrant(metaclass=Registry):
         -----
         * ``base`` itself must ultimately inherit from :class:`Registrant`.
         * Works even when ``cls`` is the *Registrant* class itself.
+        * Results are cached per *base* until the next registration.
         """
 
         if base is None:
@@ -494,27 +558,38 @@ class Registrant(metaclass=Registry):
                 f"get_subclasses() expects a Registrant-derived base class, received: {base} for class: {cls.__name__}"
             )
 
-        # Every Registrant-derived class owns its *own* registry dict.  Simply
-        # walk the MRO below *base* and aggregate them.
-        collected: list[type] = []
+        version = _registry_version[0]
+        cached = _subclasses_cache.get(base)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
 
-        def _collect(sub):
+        # Every Registrant-derived class owns its *own* registry dict.  Walk
+        # the subclass tree below *base* depth-first (pre-order) and aggregate
+        # them, deduplicating as we go.
+        collected: list[type] = []
+        seen: set[type] = set()
+        visited: set[type] = set()
+        stack: list[type] = [base]
+        while stack:
+            sub = stack.pop()
+            if sub in visited:
+                continue
+            visited.add(sub)
             # Append concrete subclasses first
-            if sub is not base and not getattr(sub, "__abstractmethods__", False):
-                collected.extend(sub.registry.values())  # type: ignore[attr-defined]
-            # Recurse into further subclasses
-            for child in sub.__subclasses__():
-                _collect(child)
-
-        _collect(base)
-        # Remove duplicates while preserving order
-        unique: list[type] = []
-        seen = set()
-        for subcls in collected:
-            if subcls not in seen:
-                unique.append(subcls)
-                seen.add(subcls)
-        return unique
+            registry = sub.registry  # type: ignore[attr-defined]
+            if (
+                registry
+                and sub is not base
+                and not getattr(sub, "__abstractmethods__", False)
+            ):
+                for subcls in registry.values():
+                    if subcls not in seen:
+                        seen.add(subcls)
+                        collected.append(subcls)
+            # Reverse so children are popped in declaration order
+            stack.extend(reversed(sub.__subclasses__()))
+        _subclasses_cache[base] = (version, tuple(collected))
+        return collected
 
     @classmethod
     def filter(cls, predicate: Callable[[type], bool]) -> FilterableGenerator[type]:
@@ -531,7 +606,7 @@ class Registrant(metaclass=Registry):
         #     except Exception:
         #         pass
         # gen = (c for c in cls.registry.values() if c not in exclude)
-        return FilterableGenerator(cls.registry.values(), [predicate])
+        return FilterableGenerator(cls.registry.values(), (predicate,))
 
 
 def get_all_subclasses(python_class: type) -> list[type]:
@@ -592,14 +667,18 @@ E = TypeVar("E", bound=Hashable)
 
 @dataclasses.dataclass
 class EventEmitter(Generic[E]):
-    _listeners: collections.defaultdict[E, set[Callable]] = dataclasses.field(
-        default_factory=lambda: collections.defaultdict(set), init=False
+    # Handlers per event are an immutable tuple, rebuilt on (rare) registration
+    # changes so emit() can iterate it directly even if a handler removes itself.
+    _listeners: dict[E, tuple[Callable, ...]] = dataclasses.field(
+        default_factory=dict, init=False
     )
 
     def on(self, event: E, handler: Callable | None = None):
         """Register an event handler for the given event."""
         if handler:
-            self._listeners[event].add(handler)
+            handlers = self._listeners.get(event, ())
+            if handler not in handlers:
+                self._listeners[event] = handlers + (handler,)
             return handler
 
         @functools.wraps(self.on)
@@ -618,11 +697,18 @@ class EventEmitter(Generic[E]):
         self.on(event, once_handler)
 
     def remove(self, event: E, handler: Callable):
-        self._listeners[event].discard(handler)
+        handlers = self._listeners.get(event, ())
+        if handler in handlers:
+            remaining = tuple(h for h in handlers if h != handler)
+            if remaining:
+                self._listeners[event] = remaining
+            else:
+                del self._listeners[event]
 
     def clear(self):
         self._listeners.clear()
 
     def emit(self, event: E, *args, **kwargs):
-        for handler in self._listeners[event]:
+        # .get() so emitting an unheard event never materializes an entry
+        for handler in self._listeners.get(event, ()):
             handler(*args, **kwargs)
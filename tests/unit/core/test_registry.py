@@ -2,12 +2,15 @@ import abc
 import functools
 import inspect
 import unittest
-from d810.core.typing import Annotated, AnyStr, Literal
+from d810.core.typing import Annotated, AnyStr, Literal, Protocol, TypedDict
 
 from d810.core import (
+    EventEmitter,
     FilterableGenerator,
     Registrant,
     deferred_property,
+    lazy_type,
+    resolve_forward_ref,
     typecheck,
     typename,
 )
@@ -29,6 +32,35 @@ class TestTypeFunctions(unittest.TestCase):
         self.assertFalse(typecheck(3, Literal[1, 2]))
         self.assertTrue(typecheck("a", Annotated[str, "meta"]))
 
+    def test_typecheck_rejected_by_isinstance(self):
+        class Proto(Protocol):
+            def f(self): ...
+
+        class TD(TypedDict):
+            x: int
+
+        self.assertFalse(typecheck(object(), Proto))
+        self.assertFalse(typecheck({"x": 1}, TD))
+
+    def test_resolve_forward_ref(self):
+        self.assertIs(resolve_forward_ref("int"), int)
+        self.assertEqual(resolve_forward_ref(list["int"]), list[int])
+        self.assertEqual(resolve_forward_ref("list['int']"), list[int])
+        self.assertEqual(
+            resolve_forward_ref(dict[str, list["int"]]), dict[str, list[int]]
+        )
+
+    def test_lazy_type_resolves_in_class_namespace(self):
+        class Owner:
+            class Inner:
+                pass
+
+        self.assertIs(lazy_type(int), int)
+        factory = lazy_type("Inner", Owner)
+        self.assertIs(factory(), Owner.Inner)
+        with self.assertRaises(ValueError):
+            lazy_type("Inner")
+
 
 class TestDeferredProperty(unittest.TestCase):
     def test_deferred_property_resolution(self):
@@ -247,6 +279,35 @@ class TestRegistrant(unittest.TestCase):
         subs = Registrant.get_subclasses(base=Base)
         self.assertEqual(subs, [A, B, C])
 
+    def test_all_is_cached_until_next_registration(self):
+        class Base(Registrant):
+            pass
+
+        class A(Base):
+            pass
+
+        first = Base.all()
+        self.assertIs(Base.all(), first)
+
+        class B(Base):
+            pass
+
+        self.assertEqual(Base.all(), (A, B))
+
+    def test_get_subclasses_sees_later_registrations(self):
+        class Base(Registrant):
+            pass
+
+        class A(Base):
+            pass
+
+        self.assertEqual(Base.get_subclasses(), [A])
+
+        class B(Base):
+            pass
+
+        self.assertEqual(Base.get_subclasses(), [A, B])
+
     def test_get_subclasses_invalid_base(self):
         with self.assertRaises(TypeError):
             Registrant.get_subclasses(base=int)
@@ -406,5 +467,32 @@ class TestRegistrant(unittest.TestCase):
         self.assertIn("preds=1", r)
 
 
+class TestEventEmitter(unittest.TestCase):
+    def test_emit_without_listeners_adds_nothing(self):
+        emitter = EventEmitter()
+        emitter.emit("missing")
+        self.assertEqual(emitter._listeners, {})
+
+    def test_once_handler_removed_during_emit(self):
+        emitter = EventEmitter()
+        calls = []
+        emitter.once("evt", lambda: calls.append("once"))
+        emitter.on("evt", lambda: calls.append("always"))
+        emitter.emit("evt")
+        emitter.emit("evt")
+        self.assertEqual(calls, ["once", "always", "always"])
+
+    def test_on_is_idempotent_and_remove_drops_event(self):
+        emitter = EventEmitter()
+        calls = []
+        handler = calls.append
+        emitter.on("evt", handler)
+        emitter.on("evt", handler)
+        emitter.emit("evt", 1)
+        self.assertEqual(calls, [1])
+        emitter.remove("evt", handler)
+        self.assertNotIn("evt", emitter._listeners)
+
+
 if __name__ == "__main__":
     unittest.main()
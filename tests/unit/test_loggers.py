@@ -1,11 +1,20 @@
 import logging
+import tempfile
 import unittest
+from unittest import mock
 
-from d810.core.logging import LoggerConfigurator, getLogger
+from d810.core import logging as d810_logging
+from d810.core.logging import D810Logger, LevelFlag, LoggerConfigurator, getLogger
 
 
 class TestLoggerConfigurator(unittest.TestCase):
     def setUp(self):
+        # set_level() flips the module-wide static flag; keep it per-test
+        d810_logging._reset_level_checks()
+        self.addCleanup(d810_logging._reset_level_checks)
+        patcher = mock.patch.object(d810_logging, "_static_config", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
         # Ensure a test logger exists under our D810 prefix
         self.prefix = "D810"
         self.test_logger_name = f"{self.prefix}.testunit"
@@ -36,6 +45,23 @@ class TestLoggerConfigurator(unittest.TestCase):
         with self.assertRaises(ValueError):
             LoggerConfigurator.set_level(self.test_logger_name, "NOTALEVEL")
 
+    def test_level_flag_tracks_set_level(self):
+        log = getLogger(self.test_logger_name)
+        LoggerConfigurator.set_level(self.test_logger_name, "WARNING")
+        self.assertFalse(log.debug_on)
+        self.assertTrue(log.error_on)
+        version = LevelFlag.get_config_version()
+        LoggerConfigurator.set_level(self.test_logger_name, "DEBUG")
+        self.assertTrue(log.debug_on)
+        self.assertEqual(LevelFlag.get_config_version(), version + 1)
+
+    def test_level_checks_are_plain_bools_while_static(self):
+        log = getLogger(self.test_logger_name)
+        self.assertIs(log.debug_on, False)
+        self.assertIs(log.warning_on, True)
+        LoggerConfigurator.set_level(self.test_logger_name, "WARNING")
+        self.assertIsInstance(log.debug_on, LevelFlag)
+
     def test_mdc_maturity_update(self):
         """Ensure that the maturity value is carried via the MDC and accessible."""
         maturity_val = "LOCOPT"
@@ -44,5 +70,42 @@ class TestLoggerConfigurator(unittest.TestCase):
         self.assertEqual(log.get_mdc("maturity"), maturity_val)
 
 
+class TestConfigureLoggers(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log_dir = tmp.name
+        # configure_loggers() installs a process-wide logger class; undo it
+        self.addCleanup(logging.setLoggerClass, logging.getLoggerClass())
+        # ...and keep the session's handlers as they are
+        patcher = mock.patch("logging.config.dictConfig")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_logger_created_after_configure_is_native(self):
+        d810_logging.configure_loggers(self.log_dir)
+        name = "D810.testunit.native"
+        # a child created first leaves a placeholder for *name*
+        child = logging.getLogger(f"{name}.child")
+        self.assertIsInstance(child, D810Logger)
+
+        log = getLogger(name, logging.WARNING)
+        self.assertIsInstance(log, D810Logger)
+        self.assertEqual(log.level, logging.WARNING)
+        # not wrapped: the manager entry and the child's parent are the same object
+        self.assertIs(logging.getLogger(name), log)
+        self.assertIs(child.parent, log)
+
+    def test_make_record_does_not_mutate_extra(self):
+        log = getLogger("D810.testunit.extra")
+        extra = {"key": 1}
+        record = log.makeRecord(
+            log.name, logging.INFO, __file__, 1, "msg", (), None, extra=extra
+        )
+        self.assertEqual(extra, {"key": 1})
+        self.assertEqual(record.key, 1)
+        self.assertTrue(hasattr(record, "maturity"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+"""Unit tests for tools/scripts/ununicode.py."""
+
+import sys
+
+import pytest
+
+from tools.scripts import ununicode
+
+
+class TestCleanText:
+    """Tests for clean_text."""
+
+    def test_ascii_input_returned_unchanged(self):
+        txt = "print('hello')\n"
+        assert ununicode.clean_text(txt) is txt
+
+    def test_replacements_and_normalization(self):
+        assert ununicode.clean_text("a–b “q” x→y café") == (
+            'a-b "q" x->y cafe'
+        )
+
+    def test_multi_char_keys_match_leftmost_longest(self, monkeypatch):
+        table = {"ßß": "<2>", "ßßß": "<3>"}
+        monkeypatch.setattr(ununicode, "_MULTI", table)
+        monkeypatch.setattr(ununicode, "_MULTI_RX", ununicode._compile_multi(table))
+        assert ununicode.clean_text("ßßßßß") == "<3><2>"
+
+    def test_smart_quotes_keep_python_literals_valid(self):
+        assert ununicode.clean_text("‘‘‘doc’’’") == "'''doc'''"
+        assert ununicode.clean_text("x = ’’") == "x = ''"
+
+    def test_unmapped_non_ascii_becomes_star(self):
+        assert ununicode.clean_text("中") == "*"
+
+
+class TestMain:
+    """Tests for the command-line file handling."""
+
+    def _run(self, monkeypatch, *argv):
+        monkeypatch.setattr(sys, "argv", ["ununicode.py", *argv])
+        ununicode.main()
+
+    def test_in_place_rewrites_file(self, monkeypatch, tmp_path):
+        path = tmp_path / "mod.py"
+        path.write_text("x = “a”\n", encoding="utf-8")
+        path.chmod(0o644)
+        self._run(monkeypatch, "-i", str(path))
+        assert path.read_text(encoding="utf-8") == 'x = "a"\n'
+        assert path.stat().st_mode & 0o777 == 0o644
+        assert [p.name for p in tmp_path.iterdir()] == ["mod.py"]
+
+    def test_in_place_through_symlink_keeps_link(self, monkeypatch, tmp_path):
+        real = tmp_path / "real.py"
+        real.write_text("x = “a”\n", encoding="utf-8")
+        link = tmp_path / "link.py"
+        try:
+            link.symlink_to(real)
+        except OSError:
+            pytest.skip("symlinks not supported here")
+        self._run(monkeypatch, "-i", str(link))
+        assert link.is_symlink()
+        assert real.read_text(encoding="utf-8") == 'x = "a"\n'
+
+    def test_output_file_untouched_on_decode_error(self, monkeypatch, tmp_path):
+        src = tmp_path / "bad.py"
+        src.write_bytes(b"ok = 1\n" * 10 + b"\xff\n")
+        dst = tmp_path / "out.py"
+        dst.write_text("previous\n", encoding="utf-8")
+        with pytest.raises(SystemExit):
+            self._run(monkeypatch, str(src), str(dst))
+        assert dst.read_text(encoding="utf-8") == "previous\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.py", "out.py"]
@@ -1,45 +1,75 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import argparse
+import contextlib
+import os
+import re
+import shutil
 import sys
+import tempfile
+import typing
 import unicodedata
 from pathlib import Path
 
 
+_BUFFER_SIZE = 1 << 20
+
+# Unicode substitutions. Single-character keys are applied in one pass via
+# str.translate; longer keys are folded into a single alternation regex.
+_REPLACEMENTS = {
+    "–": "-",  # en-dash → hyphen
+    "‐": "-",  # unicode hyphen → hyphen
+    "‑": "-",  # unicode hyphen → hyphen
+    "\u00a0": " ",  # non-breaking space → regular space
+    "\u200b": "",  # zero-width space → removed
+    "\u200c": "",  # zero-width non-joiner → removed
+    "\u200d": "",  # zero-width joiner → removed
+    "\u202f": " ",  # narrow no-break space → regular space
+    "\u2060": "",  # word joiner → removed
+    "\ufeff": "",  # zero-width no-break space (BOM) → removed
+    "\u2192": "->",  # right arrow → ->
+    "—": "-",  # em-dash → hyphen
+    "’": "'",  # right single quote → straight
+    "‘": "'",  # left single quote → straight
+    "“": '"',  # left double quote → straight
+    "”": '"',  # right double quote → straight
+    "…": "...",  # horizontal ellipsis → ...
+    "【": "[",  # left square bracket → [
+    "】": "]",  # right square bracket → ]
+    "†": "+",  # dagger → *
+    "‡": "*",  # double dagger → *
+    "§": "*",  # section sign → *
+    "¶": "*",  # paragraph sign → *
+    "™": "*",  # trademark symbol → *
+    "©": "*",  # copyright symbol → *
+    "®": "*",  # registered trademark symbol → *
+    "•": "*",
+    "◦": "*",
+}
+_TABLE = str.maketrans({k: v for k, v in _REPLACEMENTS.items() if len(k) == 1})
+
+
+def _compile_multi(mapping: dict[str, str]) -> "re.Pattern[str] | None":
+    """Compile multi-character *mapping* keys into one alternation regex."""
+    if not mapping:
+        return None
+    # Longest keys first so overlapping sequences match leftmost-longest
+    keys = sorted(mapping, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, keys)))
+
+
+_MULTI = {k: v for k, v in _REPLACEMENTS.items() if len(k) > 1}
+_MULTI_RX = _compile_multi(_MULTI)
+
+
 def clean_text(txt: str) -> str:
+    # Pure-ASCII input has nothing to replace or normalize
+    if txt.isascii():
+        return txt
     # First, handle special characters
-    replacements = {
-        "–": "-",  # en-dash → hyphen
-        "‐": "-",  # unicode hyphen → hyphen
-        "‑": "-",  # unicode hyphen → hyphen
-        "\u00a0": " ",  # non-breaking space → regular space
-        "\u200b": "",  # zero-width space → removed
-        "\u200c": "",  # zero-width non-joiner → removed
-        "\u200d": "",  # zero-width joiner → removed
-        "\u202f": " ",  # narrow no-break space → regular space
-        "\u2060": "",  # word joiner → removed
-        "\ufeff": "",  # zero-width no-break space (BOM) → removed
-        "\u2192": "->",  # right arrow → ->
-        "—": "-",  # em-dash → hyphen
-        "’": "'",  # right single quote → straight
-        "‘": "'",  # left single quote → straight
-        "“": '"',  # left double quote → straight
-        "”": '"',  # right double quote → straight
-        "【": "[",  # left square bracket → [
-        "】": "]",  # right square bracket → ]
-        "†": "+",  # dagger → *
-        "‡": "*",  # double dagger → *
-        "§": "*",  # section sign → *
-        "¶": "*",  # paragraph sign → *
-        "™": "*",  # trademark symbol → *
-        "©": "*",  # copyright symbol → *
-        "®": "*",  # registered trademark symbol → *
-        "`": "`",  # backtick → `,
-        "•": "*",
-        "◦": "*",
-    }
-    for uni, ascii_ in replacements.items():
-        txt = txt.replace(uni, ascii_)
+    if _MULTI_RX is not None:
+        txt = _MULTI_RX.sub(lambda m: _MULTI[m.group(0)], txt)
+    txt = txt.translate(_TABLE)
     normalized = unicodedata.normalize("NFKD", txt)
     result = []
     for char in normalized:
@@ -57,6 +87,45 @@ def clean_text(txt: str) -> str:
     return "".join(result)
 
 
+def clean_stream(src: typing.TextIO, dst: typing.TextIO) -> None:
+    """Clean *src* line by line into *dst* without buffering the whole file."""
+    for line in src:
+        dst.write(clean_text(line))
+
+
+def write_atomically(src: typing.ContextManager[typing.TextIO], target: Path) -> None:
+    """Clean *src* into *target* through a sibling temp file.
+
+    *src* is closed before the final rename (Windows cannot replace an open
+    file), and the temp file is removed if any step fails, so *target* is
+    either left untouched or fully rewritten.
+    """
+    tmp_name = None
+    try:
+        with src as fin, tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=target.parent,
+            prefix=f".{target.name}.",
+            delete=False,
+        ) as tmp:
+            tmp_name = tmp.name
+            clean_stream(fin, tmp)
+        if target.exists():
+            shutil.copymode(target, tmp_name)
+        else:
+            # NamedTemporaryFile is 0600; give new files the usual umask mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, target)
+    except BaseException:
+        if tmp_name is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+        raise
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Clean weird Unicode characters in Python source (stdin→stdout by default)."
@@ -86,23 +155,25 @@ def main():
         # read
         if args.input_file:
             try:
-                content = Path(args.input_file).read_text(encoding="utf-8")
+                src = open(
+                    args.input_file, "r", encoding="utf-8", buffering=_BUFFER_SIZE
+                )
             except FileNotFoundError:
                 parser.error(f"File '{args.input_file}' not found")
         else:
             if sys.stdin.isatty():
                 parser.error("No input_file and nothing piped in")
-            content = sys.stdin.read()
-
-        cleaned = clean_text(content)
+            src = contextlib.nullcontext(sys.stdin)
 
         # write
+        # Resolve symlinks so the rename updates the real file, not the link
         if args.in_place:
-            Path(args.input_file).write_text(cleaned, encoding="utf-8")
+            write_atomically(src, Path(args.input_file).resolve())
         elif args.output_file:
-            Path(args.output_file).write_text(cleaned, encoding="utf-8")
+            write_atomically(src, Path(args.output_file).resolve())
         else:
-            sys.stdout.write(cleaned)
+            with src as src:
+                clean_stream(src, sys.stdout)
 
     except Exception as e:
         parser.error(f"Unexpected error: {e}")
@@ -110,7 +181,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-if __name__ == "__main__":
-    main()
-if __name__ == "__main__":
-    main()